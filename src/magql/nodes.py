@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import dataclasses
 import enum
 import inspect
 import typing as t
@@ -116,6 +117,9 @@ def resolve_item(parent: t.Any, info: GraphQLResolveInfo, **kwargs: t.Any) -> t.
     return parent.get(info.field_name)
 
 
+_builtin_resolvers: tuple[ResolverCallable, ...] = (resolve_attr, resolve_item)
+"""Resolvers that :meth:`Field._make_graphql_node` can pass to GraphQL directly."""
+
 _VCT = t.TypeVar("_VCT")
 
 
@@ -157,17 +161,24 @@ class _DataValidatorNode(_BaseValidatorNode[DataValidatorCallable]):
         raise NotImplementedError
 
     def validate(self, info: GraphQLResolveInfo, data: dict[str, t.Any]) -> None:
-        # Empty is top-level. Others are Argument/InputField names.
-        errors: dict[str, list[t.Any]] = {"": []}
+        # Nothing to validate, don't set up error collection.
+        if not self._items_to_validate and not self.validators:
+            return
+
+        # Empty is top-level. Others are Argument/InputField names. Lists are only
+        # created when there are errors, most validation passes with no errors.
+        errors: dict[str, list[t.Any]] = {}
 
         # Validate individual values in the collection first. Child nodes will call
         # validate on their children first as well, resulting in depth-first validation.
         for name, item in self._items_to_validate.items():
-            if name not in data:
+            value = data.get(name, graphql.Undefined)
+
+            if value is graphql.Undefined:
                 continue
 
             try:
-                item.validate(info, data[name], data)
+                item.validate(info, value, data)
             except ValidationError as e:
                 # Should always be a list here.
                 errors[name] = e.message  # type: ignore[assignment]
@@ -194,92 +205,126 @@ class _DataValidatorNode(_BaseValidatorNode[DataValidatorCallable]):
                             errors[k].append(v)
                 # A list of top-level messages, extend the existing list.
                 elif isinstance(e.message, list):
-                    errors[""].extend(e.message)
+                    errors.setdefault("", []).extend(e.message)
                 # A single top-level message, append to the existing list.
                 else:
-                    errors[""].append(e.message)
-
-        if not errors[""]:
-            del errors[""]
+                    errors.setdefault("", []).append(e.message)
 
         if errors:
+            # Top-level messages are listed before individual fields.
+            if "" in errors:
+                errors = {"": errors.pop(""), **errors}
+
             raise ValidationError(errors)
 
 
-def _validate_value(
-    type: Type,
-    validators: list[ValueValidatorCallable],
-    info: GraphQLResolveInfo,
-    value: t.Any,
-    data: dict[str, t.Any],
-) -> None:
-    """The implementation of :meth:`_ValueValidatorNode.validate`. This is defined as
-    a separate function because of how it's called recursively for nested list types.
-    A list in the validator list indicates that the list type should be unwrapped one
-    level then have the validators applied to each item. Lists can be arbitrarily
-    nested, so this can happen recursively.
+@dataclasses.dataclass()
+class _ValidatorPlan:
+    """A list of value validators prepared by :func:`_compile_validators`, so that
+    :func:`_validate_value` doesn't need to inspect the list on every call.
     """
-    errors = []
 
-    # Unwrap non-null to get named type or list. If the unwrapped type is an
-    # InputObject, it also has validation.
-    if isinstance(type, NonNull):
-        type = type.type  # type: ignore[assignment]
+    input_object: InputObject | None
+    """The type of the value if it is an :class:`InputObject`, which has its own
+    validation.
+    """
 
-    # If this is an InputObject instead of a scalar, need to start the data validator
-    # process again for it, so it can run InputField validators, etc.
-    if isinstance(type, InputObject):
-        try:
-            type.validate(info, value)
-        except ValidationError as e:
-            # Should always be a dict here.
-            errors.append(e.message)
+    steps: list[ValueValidatorCallable | _ValidatorPlan]
+    """Each item is either a validator function to call with the value, or the plan
+    to apply to each item in the value. Kept in a single list so that errors are
+    collected in the same order as the validators were given.
+    """
+
+    source: tuple[t.Any, ...]
+    """The validators this plan was compiled from, as returned by
+    :func:`_freeze_validators`. Compared to the current list to tell if validators
+    were added after the plan was compiled.
+    """
 
-    nested_type: Type | None = None
+
+def _freeze_validators(validators: list[t.Any]) -> tuple[t.Any, ...]:
+    """Copy a list of value validators, and any nested lists, into tuples so that it
+    can be compared to the list later even if the list was changed in place.
+    """
+    return tuple(
+        _freeze_validators(f) if isinstance(f, list) else f for f in validators
+    )
+
+
+def _compile_validators(
+    type: str | Type, validators: list[ValueValidatorCallable]
+) -> _ValidatorPlan:
+    """Prepare a list of value validators for :func:`_validate_value`. A list in the
+    validator list indicates that the list type should be unwrapped one level then have
+    the validators applied to each item. Lists can be arbitrarily nested, so each
+    sub-list is compiled recursively with the unwrapped type.
+
+    :param type: The type of the value being validated.
+    :param validators: The validators to apply to the value.
+    """
+    # Unwrap non-null to get named type or list. This doesn't change after the types
+    # are applied, so do it here instead of for every value.
+    if isinstance(type, NonNull):
+        type = type.type
+
+    steps: list[ValueValidatorCallable | _ValidatorPlan] = []
+    source: list[t.Any] = []
+    nested_type: str | Type | None = None
 
     for f in validators:
         # A list in the validator list means apply that sub-list of validators to each
         # item in the value.
         if isinstance(f, list):
             # Unwrap a list type to the next relevant type, either another list or a
-            # named type. Only do this once, if there are multiple validator lists this
-            # will be the same type for all of them.
+            # named type. Only do this once, if there are multiple validator lists
+            # this will be the same type for all of them.
             if nested_type is None:
                 nested_type = type
 
                 while isinstance(nested_type, Wrapping):
-                    nested_type = nested_type.type  # type: ignore[assignment]
+                    nested_type = nested_type.type
 
                     if isinstance(nested_type, List):
                         break
 
-            # List of errors for this item in the list.
-            list_errors = []
-
-            # Call each sub-list validator for each item, recursively.
-            for item in value:
-                try:
-                    _validate_value(nested_type, f, info, item, data)  # pyright: ignore
-                except ValidationError as e:
-                    # A list of messages, extend the list.
-                    if isinstance(e.message, list):
-                        list_errors.extend(e.message)
-                    # A single message, append to the list.
-                    else:
-                        list_errors.append(e.message)
-                else:
-                    # Placeholder for item that had no errors.
-                    list_errors.append(None)
+            nested = _compile_validators(nested_type, f)
+            steps.append(nested)
+            source.append(nested.source)
+        else:
+            steps.append(f)
+            source.append(f)
+
+    # If this is an InputObject instead of a scalar, need to start the data validator
+    # process again for it, so it can run InputField validators, etc.
+    input_object = type if isinstance(type, InputObject) else None
+    return _ValidatorPlan(input_object, steps, tuple(source))
+
+
+def _validate_value(
+    plan: _ValidatorPlan,
+    info: GraphQLResolveInfo,
+    value: t.Any,
+    data: dict[str, t.Any],
+) -> None:
+    """The implementation of :meth:`_ValueValidatorNode.validate`. This is defined as
+    a separate function because of how it's called recursively for nested list types.
+    The validators have already been prepared by :func:`_compile_validators`.
+    """
+    errors = []
 
-            # If at least one item had errors (not None), validation failed.
-            if any(list_errors):
-                errors.append(list_errors)
+    if plan.input_object is not None:
+        try:
+            plan.input_object.validate(info, value)
+        except ValidationError as e:
+            # Should always be a dict here.
+            errors.append(e.message)
 
-        # A function in the validator list. The nested list behavior above will
+    for step in plan.steps:
+        # A function in the validator list. The nested list behavior below will
         # eventually end up here.
-        else:
+        if not isinstance(step, _ValidatorPlan):
             try:
-                f(info, value, data)
+                step(info, value, data)
             except ValidationError as e:
                 # A list of messages, extend the list.
                 if isinstance(e.message, list):
@@ -288,6 +333,30 @@ def _validate_value(
                 else:
                     errors.append(e.message)
 
+            continue
+
+        # List of errors for this item in the list.
+        list_errors = []
+
+        # Call each sub-list validator for each item, recursively.
+        for item in value:
+            try:
+                _validate_value(step, info, item, data)
+            except ValidationError as e:
+                # A list of messages, extend the list.
+                if isinstance(e.message, list):
+                    list_errors.extend(e.message)
+                # A single message, append to the list.
+                else:
+                    list_errors.append(e.message)
+            else:
+                # Placeholder for item that had no errors.
+                list_errors.append(None)
+
+        # If at least one item had errors (not None), validation failed.
+        if any(list_errors):
+            errors.append(list_errors)
+
     if errors:
         raise ValidationError(errors)
 
@@ -300,6 +369,21 @@ class _ValueValidatorNode(_BaseValidatorNode[ValueValidatorCallable]):
     defined elsewhere.
     """
 
+    _validator_plan: _ValidatorPlan | None = None
+    """Cached result of :meth:`_prepare_validators`. Reset when the type is resolved
+    by :meth:`_apply_types`, and compiled again by :meth:`validate` if
+    :attr:`validators` no longer matches.
+    """
+
+    def _prepare_validators(self) -> _ValidatorPlan:
+        """Compile :attr:`validators` with :func:`_compile_validators` and cache the
+        result. This is the only place the plan is cached. Called by
+        :meth:`.Schema._find_nodes` once all types have been applied, so that nested
+        wrapping types are resolved as well.
+        """
+        plan = self._validator_plan = _compile_validators(self.type, self.validators)
+        return plan
+
     def validate(
         self, info: GraphQLResolveInfo, value: t.Any, data: dict[str, t.Any]
     ) -> None:
@@ -310,13 +394,18 @@ class _ValueValidatorNode(_BaseValidatorNode[ValueValidatorCallable]):
         :param value: The value being validated.
         :param data: All input items being validated, of which this is one item.
         """
-        _validate_value(
-            self.type,  # type: ignore[arg-type]
-            self.validators,
-            info,
-            value,
-            data,
-        )
+        plan = self._validator_plan
+
+        # Not prepared by a schema, compile the current validators without caching
+        # them, since the type may not be resolved yet.
+        if plan is None:
+            plan = _compile_validators(self.type, self.validators)
+        # Validators were added, with the decorator or to the list directly, after the
+        # schema prepared the plan. The types are resolved, so compile and cache again.
+        elif plan.source != _freeze_validators(self.validators):
+            plan = self._prepare_validators()
+
+        _validate_value(plan, info, value, data)
 
 
 class _BaseObject(NamedType):
@@ -476,6 +565,11 @@ class Union(NamedType):
         Use :meth:`add_type` instead of modifying this directly.
         """
 
+        self._subclass_to_name: dict[type[t.Any], str] = {}
+        """Map of Python classes that are not in :attr:`py_to_name` to the name of
+        their nearest base class that is. Filled in by :meth:`resolve_type`.
+        """
+
         self.description: str | None = maybe_cleandoc(description)
         """Help text to show in the schema."""
 
@@ -503,6 +597,7 @@ class Union(NamedType):
             gql_name = gql_type
 
         self.py_to_name[py_type] = gql_name
+        self._subclass_to_name.clear()
 
     def resolve_type(
         self, value: t.Any, info: GraphQLResolveInfo, node: graphql.GraphQLUnionType
@@ -510,11 +605,33 @@ class Union(NamedType):
         """Resolves the Python value returned by a field's resolver to a specific object
         name within this union.
 
+        If the value's class was not added, the nearest base class that was added is
+        used instead.
+
         :param value: The value returned by the field's resolver.
         :param info: GraphQL resolve info. Mainly useful for ``info.context``.
         :param node: The GraphQL union being resolved.
         """
-        return self.py_to_name[type(value)]
+        py_type = type(value)
+        name = self.py_to_name.get(py_type)
+
+        if name is not None:
+            return name
+
+        name = self._subclass_to_name.get(py_type)
+
+        if name is not None:
+            return name
+
+        # Walk the class hierarchy once, then remember the result for this class.
+        for base in py_type.__mro__[1:]:
+            name = self.py_to_name.get(base)
+
+            if name is not None:
+                self._subclass_to_name[py_type] = name
+                return name
+
+        raise KeyError(py_type)
 
     def _find_nodes(self) -> t.Iterator[str | Node]:
         yield from self.types
@@ -552,6 +669,12 @@ class Field(_DataValidatorNode):
         query. Defaults to attribute lookup by the name of the field in the object.
     :param description: Help text to show in the schema.
     :param deprecation: Deprecation message to show in the schema.
+
+    .. versionchanged:: 1.2
+        A field using :func:`resolve_attr` or :func:`resolve_item` with no arguments,
+        validators, or pre-resolver passes the resolver to GraphQL directly. After
+        the schema is built, add validators to such a field with :meth:`validator`
+        rather than appending to :attr:`validators`.
     """
 
     def __init__(
@@ -592,6 +715,7 @@ class Field(_DataValidatorNode):
         :exc:`ValidationError` to stop with an error instead.
         """
         self._pre_resolve = f
+        self._use_full_resolve()
         return f
 
     def resolver(self, f: ResolverCallable) -> ResolverCallable:
@@ -609,8 +733,23 @@ class Field(_DataValidatorNode):
             self.description = obj_cleandoc(f)
 
         self._resolve = f
+        self._use_full_resolve()
         return f
 
+    def validator(self, f: DataValidatorCallable) -> DataValidatorCallable:
+        """Decorate a function to append to the list of validators."""
+        self.validators.append(f)
+        self._use_full_resolve()
+        return f
+
+    def _use_full_resolve(self) -> None:
+        """If the GraphQL field was already created with a built-in resolver passed
+        directly, use :meth:`resolve` instead so that a resolver, pre-resolver, or
+        validator added after the schema is built is still called.
+        """
+        if self._graphql_node is not None:
+            self._graphql_node.resolve = self.resolve
+
     def resolve(
         self, parent: t.Any, info: GraphQLResolveInfo, **kwargs: t.Any
     ) -> t.Any:
@@ -652,10 +791,25 @@ class Field(_DataValidatorNode):
         self.type = _to_type(self.type, type_map)
 
     def _make_graphql_node(self) -> graphql.GraphQLField:
+        resolve: ResolverCallable = self.resolve
+
+        # The built-in resolvers never raise ValidationError. If there is also nothing
+        # to call or validate first, GraphQL can call them directly. A subclass that
+        # overrides resolve must still have it called. The decorators switch back to
+        # resolve if they are used after this.
+        if (
+            type(self).resolve is Field.resolve
+            and self._resolve in _builtin_resolvers
+            and self._pre_resolve is None
+            and not self.args
+            and not self.validators
+        ):
+            resolve = self._resolve
+
         return graphql.GraphQLField(
             type_=self.type._to_graphql(),  # type: ignore[union-attr]
             args={name: arg._to_graphql() for name, arg in self.args.items()},
-            resolve=self.resolve,
+            resolve=resolve,
             description=maybe_cleandoc(self.description),
             deprecation_reason=maybe_cleandoc(self.deprecation),
             extensions={"magql_node": self},
@@ -703,6 +857,7 @@ class Argument(_ValueValidatorNode):
 
     def _apply_types(self, type_map: dict[str, NamedType | None]) -> None:
         self.type = _to_type(self.type, type_map)
+        self._validator_plan = None
 
     def _make_graphql_node(self) -> graphql.GraphQLArgument:
         return graphql.GraphQLArgument(
@@ -804,6 +959,7 @@ class InputField(_ValueValidatorNode):
 
     def _apply_types(self, type_map: dict[str, NamedType | None]) -> None:
         self.type = _to_type(self.type, type_map)
+        self._validator_plan = None
 
     def _make_graphql_node(self) -> graphql.GraphQLInputField:
         return graphql.GraphQLInputField(
@@ -1008,15 +1164,10 @@ def _expand_type_shortcut(
     if items is None:
         return {}
 
-    out = {}
-
-    for k, v in items.items():
-        if isinstance(v, cls):
-            out[k] = v
-        else:
-            out[k] = cls(v)  # type: ignore[arg-type]
-
-    return out
+    return {
+        k: v if isinstance(v, cls) else cls(v)  # type: ignore[arg-type]
+        for k, v in items.items()
+    }
 
 
 def _to_type(value: str | Type, type_map: dict[str, NamedType | None]) -> str | Type:
@@ -1048,7 +1199,13 @@ def _to_type(value: str | Type, type_map: dict[str, NamedType | None]) -> str |
 
     while wrappers:
         w = wrappers.pop()
-        out = w(out)
+
+        # Use the wrappers cached on the type, so that the same name used in many
+        # places shares one wrapper instance and its GraphQL node.
+        if isinstance(out, Type):
+            out = out.non_null if w is NonNull else out.list
+        else:
+            out = w(out)
 
     return out
 
@@ -126,6 +126,13 @@ class Schema:
 
             node._apply_types(type_map)
 
+        # Wrapping types may have been resolved after the nodes that use them, so value
+        # validators can only be compiled once all types are applied. Doing it here
+        # avoids compiling them during the first request.
+        for node in seen:
+            if isinstance(node, nodes._ValueValidatorNode):
+                node._prepare_validators()
+
     def to_graphql(self) -> graphql.GraphQLSchema:
         """Finalize the Magql schema by converting it and all its nodes to a
         GraphQL-Core schema. Will return the same instance each time it is called.
@@ -7,6 +7,7 @@ import graphql
 import pytest
 
 import magql
+from magql.testing import expect_validation_error
 
 
 def test_object() -> None:
@@ -160,3 +161,39 @@ def test_to_graphql_cached() -> None:
     g2 = obj._to_graphql()
     assert g1 is g2
     assert g1.fields["id"] is g2.fields["id"]
+
+
+def test_field_direct_resolve() -> None:
+    """A field using a built-in resolver with nothing to validate passes the
+    resolver to GraphQL directly.
+    """
+    field = magql.Field(magql.String)
+    assert field._to_graphql().resolve is magql.resolve_attr
+    field = magql.Field(magql.String, args={"id": magql.Int})
+    assert field._to_graphql().resolve == field.resolve
+
+    class CustomField(magql.Field):
+        def resolve(
+            self, parent: t.Any, info: graphql.GraphQLResolveInfo, **kwargs: t.Any
+        ) -> t.Any:
+            return "custom"
+
+    field = CustomField(magql.String)
+    assert field._to_graphql().resolve == field.resolve
+
+
+@pytest.mark.parametrize("decorator", ["pre_resolver", "validator"])
+def test_field_direct_resolve_decorated_later(decorator: str) -> None:
+    """Using a decorator on a field after the schema is built switches a directly
+    passed resolver back to the full resolve process.
+    """
+    s = magql.Schema()
+    s.query.fields["x"] = field = magql.Field("String", resolve=magql.resolve_item)
+    s.to_graphql()
+
+    def fail(*args: t.Any, **kwargs: t.Any) -> None:
+        raise magql.ValidationError("Denied.")
+
+    getattr(field, decorator)(fail)
+    result = expect_validation_error(s, "{ x }", root={"x": "ok"})
+    assert result == {"": ["Denied."]}
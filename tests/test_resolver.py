@@ -8,6 +8,7 @@ import graphql
 
 import magql
 from magql.testing import expect_data
+from magql.testing import expect_validation_error
 
 
 @dataclasses.dataclass()
@@ -55,3 +56,32 @@ def test_resolver_decorator() -> None:
 
     result = expect_data(s, "{ user(id: 1) { name } }")
     assert result == {"user": {"name": "abc"}}
+
+
+def test_no_args_validation_error() -> None:
+    """A field without arguments or validators can still raise a validation error
+    from its resolver.
+    """
+    s = magql.Schema()
+
+    @s.query.field("user", "String")
+    def resolve_user(
+        parent: t.Any, info: graphql.GraphQLResolveInfo, **kwargs: t.Any
+    ) -> str:
+        raise magql.ValidationError("Not allowed.")
+
+    result = expect_validation_error(s, "{ user }")
+    assert result == {"": ["Not allowed."]}
+
+
+def test_union_subclass() -> None:
+    """A union resolves a subclass of an added class to the base class's type."""
+
+    class Admin(User):
+        pass
+
+    s = magql.Schema(types=[magql.Object("User", fields={"name": "String"})])
+    s.query.fields["person"] = magql.Field(magql.Union("Person", types={User: "User"}))
+    root = SimpleNamespace(person=Admin(1, "abc"))
+    result = expect_data(s, "{ person { __typename ... on User { name } } }", root=root)
+    assert result == {"person": {"__typename": "User", "name": "abc"}}
@@ -83,3 +83,31 @@ def test_unused() -> None:
     gs = ms.to_graphql()
     assert "UserInput" not in gs.type_map
     assert "Mutation" not in gs.type_map
+
+
+def test_wrapped_reference_shared() -> None:
+    """Wrapped type names use the wrapper cached on the resolved type, so the same
+    name used in multiple places shares a single wrapper.
+    """
+    ms = magql.Schema()
+    ms.query.fields["user"] = magql.Field("[User!]!")
+    ms.mutation.fields["userCreate"] = magql.Field("[User!]!")
+    user = magql.Object("User")
+    ms.add_type(user)
+    ms._find_nodes()
+    assert ms.query.fields["user"].type is user.non_null.list.non_null
+    assert ms.mutation.fields["userCreate"].type is user.non_null.list.non_null
+
+
+def test_validators_prepared() -> None:
+    """Value validators are compiled after all types are applied, including type
+    names inside wrapping types.
+    """
+    ms = magql.Schema()
+    arg = magql.Argument(magql.NonNull("UserInput"))
+    ms.query.fields["user"] = magql.Field("String", args={"input": arg})
+    user_input = magql.InputObject("UserInput")
+    ms.add_type(user_input)
+    ms._find_nodes()
+    assert arg._validator_plan is not None
+    assert arg._validator_plan.input_object is user_input
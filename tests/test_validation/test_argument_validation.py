@@ -4,6 +4,7 @@ import typing as t
 from dataclasses import dataclass
 
 import graphql
+import pytest
 
 import magql.validators
 from magql.testing import expect_data
@@ -131,3 +132,55 @@ def test_unhandled_error() -> None:
         schema, """{ user(username: "aa", hobbies: null) { username } }"""
     )
     assert "'NoneType' has no len()" in result.message
+
+
+def test_validator_added_after_validate() -> None:
+    """Validators added after validating are used the next time."""
+    arg = magql.Argument("Int")
+    arg.validate(None, 1, {})  # type: ignore[arg-type]
+
+    @arg.validator
+    def validate_fail(
+        info: graphql.GraphQLResolveInfo, value: int, data: dict[str, t.Any]
+    ) -> None:
+        raise magql.ValidationError("Invalid.")
+
+    with pytest.raises(magql.ValidationError):
+        arg.validate(None, 1, {})  # type: ignore[arg-type]
+
+    arg.validators.clear()
+    arg.validate(None, 1, {})  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("how", ["decorator", "append", "nested"])
+def test_validator_added_after_build(how: str) -> None:
+    """Validators added after the schema is built are used, whether they are added
+    with the decorator, to the list, or to a nested list.
+    """
+    s = magql.Schema()
+    arg = magql.Argument("[Int!]", validators=[[]])  # type: ignore[list-item]
+    s.query.fields["x"] = magql.Field(
+        "String", args={"n": arg}, resolve=magql.resolve_item
+    )
+    s.to_graphql()
+    assert expect_data(s, "{ x(n: [1]) }", root={"x": "ok"}) == {"x": "ok"}
+
+    def validate_fail(
+        info: graphql.GraphQLResolveInfo, value: t.Any, data: dict[str, t.Any]
+    ) -> None:
+        raise magql.ValidationError("Invalid.")
+
+    expect: list[t.Any]
+
+    if how == "decorator":
+        arg.validator(validate_fail)
+        expect = ["Invalid."]
+    elif how == "append":
+        arg.validators.append(validate_fail)
+        expect = ["Invalid."]
+    else:
+        arg.validators[0].append(validate_fail)  # type: ignore[attr-defined]
+        expect = [["Invalid."]]
+
+    result = expect_validation_error(s, "{ x(n: [1]) }", root={"x": "ok"})
+    assert result == {"n": expect}
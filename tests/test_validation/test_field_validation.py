@@ -4,6 +4,7 @@ import typing as t
 from dataclasses import dataclass
 
 import graphql
+import pytest
 
 import magql.validators
 from magql.testing import expect_data
@@ -121,3 +122,44 @@ def test_invalid_multiple_errors() -> None:
     result = expect_validation_error(schema, valid_op, variables=variables)
     assert result[""][0].startswith("Profession cannot be")
     assert result[""][1].startswith("Profession must start with")
+
+
+def test_top_level_errors_first() -> None:
+    """Top-level messages are listed before messages for individual arguments."""
+
+    def validate_name(
+        info: graphql.GraphQLResolveInfo, value: t.Any, data: dict[str, t.Any]
+    ) -> None:
+        raise magql.ValidationError("Invalid name.")
+
+    field = magql.Field(
+        "String", args={"name": magql.Argument("String", validators=[validate_name])}
+    )
+
+    @field.validator
+    def validate_field(
+        info: graphql.GraphQLResolveInfo, data: dict[str, t.Any]
+    ) -> None:
+        raise magql.ValidationError("Invalid field.")
+
+    with pytest.raises(magql.ValidationError) as exc_info:
+        field.validate(None, {"name": "a"})  # type: ignore[arg-type]
+
+    assert exc_info.value.message == {"": ["Invalid field."], "name": ["Invalid name."]}
+    assert list(exc_info.value.message) == ["", "name"]
+
+
+def test_replaced_args_validated() -> None:
+    """Replacing a field's args after creating it still validates the new args."""
+
+    def validate_positive(
+        info: graphql.GraphQLResolveInfo, value: t.Any, data: dict[str, t.Any]
+    ) -> None:
+        if value < 0:
+            raise magql.ValidationError("Must be positive.")
+
+    s = magql.Schema()
+    s.query.fields["x"] = field = magql.Field("String", resolve=magql.resolve_item)
+    field.args = {"n": magql.Argument("Int", validators=[validate_positive])}
+    result = expect_validation_error(s, "{ x(n: -1) }", root={"x": "ok"})
+    assert result == {"n": ["Must be positive."]}